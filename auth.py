@@ -1,11 +1,21 @@
 import base64
+import contextlib
+import functools
+import hashlib
+import json
 import logging
+import os
+import threading
 import time
-from urllib.parse import urlparse
 
-import requests
+try:
+    import fcntl
+except ImportError:  # not available on Windows; the token file is then unlocked
+    fcntl = None
+
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
 from config import (
     WALMART_CLIENT_ID,
@@ -13,7 +23,9 @@ from config import (
     WALMART_PRIVATE_KEY_PATH,
     WALMART_KEY_VERSION,
     TOKEN_URL,
+    TOKEN_CACHE_PATH,
 )
+from http_client import parse_json, session, url_path
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +35,40 @@ _token_cache = {
     "expires_at": 0,
 }
 
+_token_lock = threading.Lock()
+
+# Set once the required credentials have been checked
+_credentials_validated = False
+
+# Basic auth header for the token endpoint, built on first use
+_basic_auth_header = None
+
+# Parsed RSA private key, loaded once per process
+_private_key_cache = None
+_private_key_lock = threading.Lock()
+
+# Recent (timestamp, signature) pairs keyed by (METHOD, url)
+_signature_cache = {}
+
+# Header entries that are the same for every request
+_HEADERS_TEMPLATE = {
+    "WM_CONSUMER.ID": WALMART_CLIENT_ID,
+    "WM_SEC.KEY_VERSION": WALMART_KEY_VERSION,
+    "Content-Type": "application/json",
+}
+
+_SIGNATURE_PADDING = padding.PKCS1v15()
+# The message is hashed with hashlib, so the key signs the digest directly
+_SIGNATURE_HASH = Prehashed(hashes.SHA256())
+
 
 def _validate_credentials():
-    """Ensure required credentials are configured."""
+    """Ensure required credentials are configured (checked once per process)."""
+    global _credentials_validated
+
+    if _credentials_validated:
+        return
+
     if not WALMART_CLIENT_ID:
         raise ValueError("WALMART_CLIENT_ID is not set in .env")
     if not WALMART_CLIENT_SECRET:
@@ -33,53 +76,194 @@ def _validate_credentials():
     if not WALMART_PRIVATE_KEY_PATH:
         raise ValueError("WALMART_PRIVATE_KEY_PATH is not set in .env")
 
+    _credentials_validated = True
+
+
+# Credentials come from the environment at import, so check them up front;
+# a missing value is reported on the first get_auth_headers() call instead
+try:
+    _validate_credentials()
+except ValueError:
+    pass
+
+
+def _get_basic_auth_header():
+    """Return the Basic auth header value (base64 of clientId:clientSecret)."""
+    global _basic_auth_header
+
+    if _basic_auth_header is None:
+        credentials = base64.b64encode(
+            f"{WALMART_CLIENT_ID}:{WALMART_CLIENT_SECRET}".encode()
+        ).decode()
+        _basic_auth_header = f"Basic {credentials}"
+
+    return _basic_auth_header
+
+
+@contextlib.contextmanager
+def _token_file_lock():
+    """Hold an exclusive lock on the token cache across processes.
+
+    Parallel CLI runs then refresh the token once instead of each hitting
+    the token endpoint. If the lock file cannot be created, runs unlocked.
+    """
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), mode=0o700, exist_ok=True)
+        lock_file = open(TOKEN_CACHE_PATH + ".lock", "a")
+    except OSError as e:
+        logger.debug("Token cache lock unavailable: %s", e)
+        lock_file = None
+
+    # Yield outside the except block so errors from the locked body are not
+    # chained to the unrelated lock-file failure
+    if lock_file is None:
+        yield
+        return
+
+    with lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _read_token_file(now):
+    """Return the (access_token, expires_at) persisted on disk, if still valid."""
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("client_id") != WALMART_CLIENT_ID:
+        return None
+    if not data.get("access_token") or now >= data.get("expires_at", 0):
+        return None
+
+    return data["access_token"], data["expires_at"]
+
+
+def _write_token_file(access_token, expires_at):
+    """Persist the token atomically, readable only by the current user."""
+    tmp_path = f"{TOKEN_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "client_id": WALMART_CLIENT_ID,
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                },
+                f,
+            )
+        os.replace(tmp_path, TOKEN_CACHE_PATH)
+    except OSError as e:
+        logger.warning("Could not persist OAuth token to %s: %s", TOKEN_CACHE_PATH, e)
+
+
+def invalidate_access_token():
+    """Drop the cached OAuth token from memory and disk.
+
+    Called when the API rejects the token (401), e.g. because another host
+    with the same client ID obtained a new one, so the next request
+    re-authenticates instead of reusing it until expiry.
+    """
+    with _token_lock, _token_file_lock():
+        _token_cache["access_token"] = None
+        _token_cache["expires_at"] = 0
+        try:
+            os.remove(TOKEN_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove cached OAuth token %s: %s", TOKEN_CACHE_PATH, e)
+            return
+
+    logger.warning("Discarded cached OAuth token (%s) after a 401 response", TOKEN_CACHE_PATH)
+
 
-def _get_access_token():
+def _get_access_token(now=None):
     """Fetch an OAuth access token, using cache if still valid.
 
     POST https://api-gateway.walmart.com/v3/token
     with Basic auth (base64 of clientId:clientSecret).
+
+    The token is cached in memory and persisted to TOKEN_CACHE_PATH so later
+    runs can reuse it. Refreshes are serialized across threads and processes
+    so parallel fetches share one token. Callers that already read the
+    clock can pass it as now.
     """
-    now = time.time()
+    if now is None:
+        now = time.time()
     if _token_cache["access_token"] and now < _token_cache["expires_at"]:
         return _token_cache["access_token"]
 
-    _validate_credentials()
+    with _token_lock, _token_file_lock():
+        # Another thread or process may have refreshed while we waited
+        now = time.time()
+        if _token_cache["access_token"] and now < _token_cache["expires_at"]:
+            return _token_cache["access_token"]
 
-    credentials = base64.b64encode(
-        f"{WALMART_CLIENT_ID}:{WALMART_CLIENT_SECRET}".encode()
-    ).decode()
-
-    headers = {
-        "Authorization": f"Basic {credentials}",
-        "Content-Type": "application/x-www-form-urlencoded",
-    }
-
-    logger.info("Requesting new OAuth access token...")
-    resp = requests.post(
-        TOKEN_URL,
-        headers=headers,
-        data="grant_type=client_credentials",
-        timeout=30,
-    )
-    resp.raise_for_status()
+        persisted = _read_token_file(now)
+        if persisted:
+            _token_cache["access_token"], _token_cache["expires_at"] = persisted
+            logger.info("Using cached OAuth token from %s", TOKEN_CACHE_PATH)
+            return _token_cache["access_token"]
+
+        _validate_credentials()
 
-    data = resp.json()
-    access_token = data["access_token"]
-    expires_in = data.get("expires_in", 3600)
+        headers = {
+            "Authorization": _get_basic_auth_header(),
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
 
-    # Cache with 60s buffer before actual expiry
-    _token_cache["access_token"] = access_token
-    _token_cache["expires_at"] = now + expires_in - 60
+        logger.info("Requesting new OAuth access token...")
+        resp = session.post(
+            TOKEN_URL,
+            headers=headers,
+            data="grant_type=client_credentials",
+            timeout=30,
+        )
+        resp.raise_for_status()
+
+        data = parse_json(resp)
+        access_token = data["access_token"]
+        expires_in = data.get("expires_in", 3600)
+
+        # Cache with 60s buffer before actual expiry
+        _token_cache["access_token"] = access_token
+        _token_cache["expires_at"] = now + expires_in - 60
+        _write_token_file(access_token, _token_cache["expires_at"])
 
     logger.info("OAuth token obtained, expires in %ds", expires_in)
     return access_token
 
 
 def _load_private_key():
-    """Load the RSA private key from the PEM file."""
-    with open(WALMART_PRIVATE_KEY_PATH, "rb") as f:
-        return serialization.load_pem_private_key(f.read(), password=None)
+    """Load the RSA private key from the PEM file, using cache if loaded."""
+    global _private_key_cache
+
+    if _private_key_cache is not None:
+        return _private_key_cache
+
+    with _private_key_lock:
+        if _private_key_cache is None:
+            with open(WALMART_PRIVATE_KEY_PATH, "rb") as f:
+                _private_key_cache = serialization.load_pem_private_key(f.read(), password=None)
+
+    return _private_key_cache
+
+
+@functools.lru_cache(maxsize=16)
+def _sign_parts_for(method, url):
+    """Return the constant (prefix, suffix) bytes around the signed timestamp.
+
+    Only the timestamp changes between requests to the same endpoint, so the
+    rest of the string to sign is built once per method and URL.
+    """
+    prefix = f"{WALMART_CLIENT_ID}\n".encode()
+    suffix = f"\n{method.upper()}\n{url_path(url)}\n".encode()
+    return prefix, suffix
 
 
 def _generate_signature(method, url, timestamp):
@@ -88,43 +272,89 @@ def _generate_signature(method, url, timestamp):
     The string to sign is:
         ConsumerID\nTimestamp\nHTTP_METHOD\nREQUEST_PATH\n
     """
-    request_path = urlparse(url).path
-
-    string_to_sign = (
-        f"{WALMART_CLIENT_ID}\n"
-        f"{timestamp}\n"
-        f"{method.upper()}\n"
-        f"{request_path}\n"
-    )
+    prefix, suffix = _sign_parts_for(method, url)
+    digest = hashlib.sha256(prefix + timestamp.encode() + suffix).digest()
 
     private_key = _load_private_key()
     signature_bytes = private_key.sign(
-        string_to_sign.encode(),
-        padding.PKCS1v15(),
-        hashes.SHA256(),
+        digest,
+        _SIGNATURE_PADDING,
+        _SIGNATURE_HASH,
     )
 
     return base64.b64encode(signature_bytes).decode()
 
 
-def get_auth_headers(method, url):
+def _get_signature(method, url, reuse_within_seconds, now):
+    """Return a (timestamp, signature) pair for the request.
+
+    A signature generated for the same method and URL less than
+    reuse_within_seconds ago is returned as-is, together with its original
+    timestamp, instead of signing again.
+    """
+    now_ms = int(now * 1000)
+    key = (method.upper(), url)
+
+    cached = _signature_cache.get(key) if reuse_within_seconds > 0 else None
+    if cached and now_ms - int(cached[0]) < reuse_within_seconds * 1000:
+        return cached
+
+    timestamp = str(now_ms)
+    signature = _generate_signature(method, url, timestamp)
+    if reuse_within_seconds > 0:
+        _signature_cache[key] = (timestamp, signature)
+    return timestamp, signature
+
+
+def _get_access_token_and_time():
+    """Return (access_token, now) for signing a request.
+
+    With a cached token, one clock read serves both the expiry check and the
+    signature timestamp. A refresh can block on the token POST or another
+    process's lock, so the clock is read again afterwards to keep the signed
+    timestamp current.
+    """
+    now = time.time()
+    if _token_cache["access_token"] and now < _token_cache["expires_at"]:
+        return _token_cache["access_token"], now
+
+    access_token = _get_access_token(now)
+    return access_token, time.time()
+
+
+def get_auth_headers(method, url, reuse_within_seconds=0):
     """Build the required Walmart API authentication headers.
 
     Args:
         method: HTTP method (GET, POST, etc.)
         url: Full request URL (path is extracted for signing)
+        reuse_within_seconds: Reuse a signature (and its timestamp) made for
+            the same method and URL within this many seconds. 0 signs anew.
     """
     _validate_credentials()
 
-    access_token = _get_access_token()
-    timestamp = str(int(time.time() * 1000))
-    signature = _generate_signature(method, url, timestamp)
+    access_token, now = _get_access_token_and_time()
+    timestamp, signature = _get_signature(method, url, reuse_within_seconds, now)
+
+    headers = _HEADERS_TEMPLATE.copy()
+    headers["Authorization"] = f"Bearer {access_token}"
+    headers["WM_SEC.AUTH_SIGNATURE"] = signature
+    headers["WM_CONSUMER.intimestamp"] = timestamp
+    return headers
+
+
+def refresh_auth_headers(headers, method, url, reuse_within_seconds=0):
+    """Update headers from get_auth_headers() in place for another request.
+
+    Only the bearer token, signature, and timestamp entries are rewritten,
+    and only when the token rolled over or a new signature was generated.
+    """
+    access_token, now = _get_access_token_and_time()
+    timestamp, signature = _get_signature(method, url, reuse_within_seconds, now)
 
-    return {
-        "Authorization": f"Bearer {access_token}",
-        "WM_CONSUMER.ID": WALMART_CLIENT_ID,
-        "WM_SEC.AUTH_SIGNATURE": signature,
-        "WM_CONSUMER.intimestamp": timestamp,
-        "WM_SEC.KEY_VERSION": WALMART_KEY_VERSION,
-        "Content-Type": "application/json",
-    }
+    bearer = "Bearer " + access_token
+    if headers["Authorization"] != bearer:
+        headers["Authorization"] = bearer
+    if headers["WM_CONSUMER.intimestamp"] != timestamp:
+        headers["WM_SEC.AUTH_SIGNATURE"] = signature
+        headers["WM_CONSUMER.intimestamp"] = timestamp
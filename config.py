@@ -10,6 +10,9 @@ WALMART_PRIVATE_KEY_PATH = os.getenv("WALMART_PRIVATE_KEY_PATH", "private_key.pe
 WALMART_KEY_VERSION = os.getenv("WALMART_KEY_VERSION", "1")
 WALMART_ADVERTISER_ID = os.getenv("WALMART_ADVERTISER_ID", "")
 
+# OAuth token persisted between runs (chmod 600)
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "walmart_para", "token.json")
+
 # API endpoints
 TOKEN_URL = "https://api-gateway.walmart.com/v3/token"
 BASE_URL = "https://developer.api.us.walmart.com/api-proxy/service/display/api/v1/api/v1"
@@ -31,8 +34,25 @@ MAX_DATE_RANGE = 60
 SKU_MAX_RANGE = 15
 
 # Polling configuration
-POLL_INTERVAL = 30        # seconds between status checks
-MAX_POLL_ATTEMPTS = 60    # ~30 min timeout
+POLL_INITIAL_INTERVAL = 2    # first wait between status checks (seconds)
+POLL_BACKOFF_FACTOR = 1.5    # wait grows by this factor after each check
+POLL_INTERVAL = 30           # max seconds between status checks
+MAX_POLL_ATTEMPTS = 60       # budget of MAX_POLL_ATTEMPTS * POLL_INTERVAL (~30 min)
+
+# Seconds a poll request may reuse the previous signature and timestamp
+# before re-signing. 0 signs every request; only raise this once the API's
+# accepted timestamp window is confirmed.
+SIGNATURE_REUSE_SECONDS = 0
+
+# HTTP connection pooling and retries
+HTTP_POOL_CONNECTIONS = 4     # distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = 8         # connections per host
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5     # seconds, doubled per retry
+HTTP_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Download streaming
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB copy buffer for gzip decompression
 
 # Snapshot expiry
 SNAPSHOT_EXPIRY_HOURS = 24
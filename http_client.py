@@ -0,0 +1,65 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to requests' stdlib json decoding
+    orjson = None
+
+from config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_RETRY_STATUSES,
+)
+
+
+def _create_session():
+    """Build a session with pooled keep-alive connections and retry/backoff.
+
+    Non-idempotent requests (POST) are not retried by urllib3's defaults.
+    Once retries are exhausted, the last response is returned so callers
+    still see it through raise_for_status().
+    """
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across auth and snapshot calls so TLS connections are reused
+session = _create_session()
+
+
+def parse_json(resp):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def url_path(url):
+    """Return the path of an absolute URL, equivalent to urlsplit(url).path.
+
+    Plain string partitioning is used instead of urllib.parse because this
+    runs on every signed request.
+    """
+    rest = url.partition("://")[2] or url
+    # The authority ends at the first "/", "?" or "#"
+    rest = rest.partition("?")[0].partition("#")[0]
+    slash = rest.find("/")
+    return rest[slash:] if slash >= 0 else ""
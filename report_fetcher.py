@@ -5,6 +5,7 @@ Automates the full workflow: create job → poll status → download gzip → de
 
 Usage:
     python report_fetcher.py --report-type campaign --start-date 2026-01-01 --end-date 2026-01-15
+    python report_fetcher.py --report-type campaign lineItem --start-date 2026-01-01 --end-date 2026-01-15
     python report_fetcher.py --report-type sku --start-date 2026-01-01 --end-date 2026-01-10 --advertiser-id 600001
 """
 
@@ -13,10 +14,13 @@ import csv
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import requests
+
 from config import WALMART_ADVERTISER_ID, VALID_REPORT_TYPES
-from snapshot_client import create_snapshot, poll_snapshot, download_report
+from snapshot_client import create_snapshot, poll_snapshot, download_report, parse_ymd
 
 REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
 
@@ -38,14 +42,16 @@ def parse_args():
         epilog=(
             "Examples:\n"
             "  python report_fetcher.py --report-type campaign --start-date 2026-01-01 --end-date 2026-01-15\n"
+            "  python report_fetcher.py --report-type campaign lineItem --start-date 2026-01-01 --end-date 2026-01-15\n"
             "  python report_fetcher.py --report-type sku --start-date 2026-01-01 --end-date 2026-01-10 --advertiser-id 600001\n"
         ),
     )
     parser.add_argument(
         "--report-type",
         required=True,
+        nargs="+",
         choices=VALID_REPORT_TYPES,
-        help="Type of report to fetch",
+        help="Type(s) of report to fetch; multiple types are fetched in parallel",
     )
     parser.add_argument(
         "--start-date",
@@ -62,15 +68,17 @@ def parse_args():
         default=None,
         help="Advertiser ID (defaults to WALMART_ADVERTISER_ID from .env)",
     )
+    parser.add_argument(
+        "--exact-row-count",
+        action="store_true",
+        help="Count summary rows with a full CSV parse (handles quoted newlines, slower)",
+    )
     return parser.parse_args()
 
 
 def validate_date_format(date_str):
     """Validate that a string is a proper YYYY-MM-DD date."""
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
-        raise ValueError(f"Invalid date format: '{date_str}'. Expected YYYY-MM-DD.")
+    parse_ymd(date_str)
 
 
 def build_output_filename(report_type, start_date, end_date, advertiser_id):
@@ -79,13 +87,48 @@ def build_output_filename(report_type, start_date, end_date, advertiser_id):
     return f"{report_type}_{start_date}_{end_date}_{advertiser_id}_{timestamp}.csv"
 
 
-def print_summary(output_path):
-    """Print a summary of the downloaded CSV file."""
+def _read_csv_summary(output_path):
+    """Return (headers, row_count) from one binary pass over the CSV.
+
+    Only the header line is decoded and parsed; data rows are counted as
+    newlines in 1 MiB blocks of the rest of the file. Assumes no newlines
+    inside quoted fields, which holds for advertising reports.
+    """
+    with open(output_path, "rb") as f:
+        # Ask the kernel for aggressive readahead on the linear scan
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        header_line = f.readline()
+        if not header_line:
+            return None, 0
+
+        headers = next(csv.reader([header_line.decode("utf-8", "replace")]), None)
+
+        newlines = 0
+        last_byte = b"\n"
+        for block in iter(lambda: f.read(1 << 20), b""):
+            newlines += block.count(b"\n")
+            last_byte = block[-1:]
+
+    # A final row without a trailing newline still counts
+    return headers, newlines + (0 if last_byte == b"\n" else 1)
+
+
+def print_summary(output_path, exact=False):
+    """Print a summary of the downloaded CSV file.
+
+    Rows are counted with a fast newline scan unless exact is set, in which
+    case the file is fully parsed with csv.reader.
+    """
     try:
-        with open(output_path, "r", newline="") as f:
-            reader = csv.reader(f)
-            headers = next(reader, None)
-            row_count = sum(1 for _ in reader)
+        if exact:
+            with open(output_path, "r", newline="") as f:
+                reader = csv.reader(f)
+                headers = next(reader, None)
+                row_count = sum(1 for _ in reader)
+        else:
+            headers, row_count = _read_csv_summary(output_path)
 
         col_count = len(headers) if headers else 0
         print("\n" + "=" * 50)
@@ -106,6 +149,75 @@ def print_summary(output_path):
         print(f"\nReport saved to: {output_path}")
 
 
+def fetch_report(report_type, start_date, end_date, advertiser_id, output_path):
+    """Create, poll, and download one snapshot report into output_path.
+
+    Returns the path of the saved CSV file.
+    """
+    logger = logging.getLogger(__name__)
+
+    # Step 1: Create snapshot
+    logger.info("=== [%s] Step 1/3: Creating snapshot job ===", report_type)
+    snapshot_id = create_snapshot(
+        advertiser_id=advertiser_id,
+        report_type=report_type,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    # Step 2: Poll for completion
+    logger.info("=== [%s] Step 2/3: Polling for job completion ===", report_type)
+    result = poll_snapshot(advertiser_id=advertiser_id, snapshot_id=snapshot_id)
+    file_url = result["details"]
+
+    # Step 3: Download and decompress
+    logger.info("=== [%s] Step 3/3: Downloading and decompressing report ===", report_type)
+    download_report(
+        file_url=file_url,
+        advertiser_id=advertiser_id,
+        output_path=output_path,
+    )
+
+    return output_path
+
+
+def _log_fetch_error(report_type, error):
+    """Log a failed report fetch according to its error type."""
+    logger = logging.getLogger(__name__)
+
+    if isinstance(error, ValueError):
+        logger.error("[%s] Validation error: %s", report_type, error)
+    elif isinstance(error, requests.exceptions.HTTPError):
+        logger.error("[%s] API error: %s", report_type, error)
+        if error.response is not None:
+            logger.error("[%s] Response body: %s", report_type, error.response.text)
+    elif isinstance(error, TimeoutError):
+        logger.error("[%s] Timeout: %s", report_type, error)
+    elif isinstance(error, RuntimeError):
+        logger.error("[%s] Runtime error: %s", report_type, error)
+    else:
+        logger.error("[%s] Unexpected error: %s", report_type, error, exc_info=error)
+
+
+def _discard_unfinished_reports(futures, output_paths):
+    """Remove partially written CSVs of reports that have not finished.
+
+    download_report() writes to "<output_path>.part" until the download
+    completes; the hard exit skips its own cleanup, so remove it here.
+    """
+    logger = logging.getLogger(__name__)
+
+    for report_type, future in futures.items():
+        part_path = output_paths[report_type] + ".part"
+        if future.done() or not os.path.exists(part_path):
+            continue
+        try:
+            os.remove(part_path)
+            logger.info("[%s] Removed incomplete report: %s", report_type, part_path)
+        except OSError as e:
+            logger.warning("[%s] Incomplete report left at %s: %s", report_type, part_path, e)
+
+
 def main():
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -128,53 +240,56 @@ def main():
     # Ensure reports directory exists
     os.makedirs(REPORTS_DIR, exist_ok=True)
 
-    # Build output path
-    filename = build_output_filename(args.report_type, args.start_date, args.end_date, advertiser_id)
-    output_path = os.path.join(REPORTS_DIR, filename)
+    # Snapshot jobs run server-side, so each report type gets its own worker
+    report_types = list(dict.fromkeys(args.report_type))
 
-    try:
-        # Step 1: Create snapshot
-        logger.info("=== Step 1/3: Creating snapshot job ===")
-        snapshot_id = create_snapshot(
-            advertiser_id=advertiser_id,
-            report_type=args.report_type,
-            start_date=args.start_date,
-            end_date=args.end_date,
+    # Build output paths
+    output_paths = {
+        report_type: os.path.join(
+            REPORTS_DIR,
+            build_output_filename(report_type, args.start_date, args.end_date, advertiser_id),
         )
+        for report_type in report_types
+    }
 
-        # Step 2: Poll for completion
-        logger.info("=== Step 2/3: Polling for job completion ===")
-        result = poll_snapshot(advertiser_id=advertiser_id, snapshot_id=snapshot_id)
-        file_url = result["details"]
-
-        # Step 3: Download and decompress
-        logger.info("=== Step 3/3: Downloading and decompressing report ===")
-        download_report(
-            file_url=file_url,
+    executor = ThreadPoolExecutor(max_workers=len(report_types))
+    futures = {
+        report_type: executor.submit(
+            fetch_report,
+            report_type=report_type,
+            start_date=args.start_date,
+            end_date=args.end_date,
             advertiser_id=advertiser_id,
-            output_path=output_path,
+            output_path=output_paths[report_type],
         )
+        for report_type in report_types
+    }
 
-        # Summary
-        print_summary(output_path)
+    failed = False
+    try:
+        for report_type, future in futures.items():
+            try:
+                output_path = future.result()
+            except Exception as e:
+                _log_fetch_error(report_type, e)
+                failed = True
+                continue
 
-    except ValueError as e:
-        logger.error("Validation error: %s", e)
-        sys.exit(1)
-    except requests.exceptions.HTTPError as e:
-        logger.error("API error: %s", e)
-        if e.response is not None:
-            logger.error("Response body: %s", e.response.text)
-        sys.exit(1)
-    except TimeoutError as e:
-        logger.error("Timeout: %s", e)
-        sys.exit(1)
-    except RuntimeError as e:
-        logger.error("Runtime error: %s", e)
-        sys.exit(1)
+            # Summary
+            print_summary(output_path, exact=args.exact_row_count)
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
-        sys.exit(130)
+        executor.shutdown(wait=False, cancel_futures=True)
+        _discard_unfinished_reports(futures, output_paths)
+        # Running workers are blocked in HTTP calls or sleeps and cannot be
+        # interrupted, so skip waiting for them on the way out
+        logging.shutdown()
+        sys.stdout.flush()
+        os._exit(130)
+
+    executor.shutdown()
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
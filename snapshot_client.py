@@ -1,30 +1,65 @@
 import gzip
+import io
 import logging
+import os
+import random
+import shutil
 import time
-from datetime import datetime, timedelta
-from urllib.parse import urlparse, parse_qs
+from datetime import date, timedelta
 
-import requests
-
-from auth import get_auth_headers
+from auth import get_auth_headers, invalidate_access_token, refresh_auth_headers
 from config import (
     BASE_URL,
     DOWNLOAD_URL,
     MAX_DATE_RANGE,
     SKU_MAX_RANGE,
+    POLL_INITIAL_INTERVAL,
+    POLL_BACKOFF_FACTOR,
     POLL_INTERVAL,
     MAX_POLL_ATTEMPTS,
+    SIGNATURE_REUSE_SECONDS,
     VALID_REPORT_TYPES,
+    DOWNLOAD_CHUNK_SIZE,
 )
+from http_client import parse_json, session, url_path
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_for_status(resp):
+    """Raise for HTTP errors, discarding the cached OAuth token on a 401."""
+    if resp.status_code == 401:
+        invalidate_access_token()
+    resp.raise_for_status()
+
+
+def parse_ymd(date_str):
+    """Parse a YYYY-MM-DD string into a date.
+
+    Slices the fixed-width fields directly rather than going through
+    datetime.strptime's format interpreter.
+    """
+    if (
+        len(date_str) == 10
+        and date_str[4] == date_str[7] == "-"
+        and date_str.isascii()
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        try:
+            return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass
+
+    raise ValueError(f"Invalid date format: '{date_str}'. Expected YYYY-MM-DD.")
+
+
 def _validate_dates(report_type, start_date, end_date):
     """Validate date range constraints for the given report type."""
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = parse_ymd(start_date)
+    end = parse_ymd(end_date)
+    today = date.today()
 
     if start > end:
         raise ValueError(f"start_date ({start_date}) must be before end_date ({end_date})")
@@ -69,10 +104,10 @@ def create_snapshot(advertiser_id, report_type, start_date, end_date):
 
     logger.info("Creating snapshot: type=%s, range=%s to %s", report_type, start_date, end_date)
     headers = get_auth_headers("POST", url)
-    resp = requests.post(url, json=payload, headers=headers, timeout=30)
-    resp.raise_for_status()
+    resp = session.post(url, json=payload, headers=headers, timeout=30)
+    _raise_for_status(resp)
 
-    data = resp.json()
+    data = parse_json(resp)
     snapshot_id = data.get("snapshotId")
     if not snapshot_id:
         raise RuntimeError(f"No snapshotId in response: {data}")
@@ -84,6 +119,10 @@ def create_snapshot(advertiser_id, report_type, start_date, end_date):
 def poll_snapshot(advertiser_id, snapshot_id):
     """Poll snapshot status until it reaches a terminal state.
 
+    Waits start at POLL_INITIAL_INTERVAL and back off exponentially (with
+    jitter) up to POLL_INTERVAL, within a total budget of
+    MAX_POLL_ATTEMPTS * POLL_INTERVAL seconds.
+
     Returns the full response dict when jobStatus is 'done'.
     Raises on 'failed', 'expired', or timeout.
     """
@@ -93,14 +132,22 @@ def poll_snapshot(advertiser_id, snapshot_id):
         "snapshotId": snapshot_id,
     }
 
-    for attempt in range(1, MAX_POLL_ATTEMPTS + 1):
-        headers = get_auth_headers("GET", url)
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
-        resp.raise_for_status()
+    budget = MAX_POLL_ATTEMPTS * POLL_INTERVAL
+    deadline = time.monotonic() + budget
+    delay = POLL_INITIAL_INTERVAL
+    attempt = 0
+
+    # Built once; later polls only refresh the token/signature entries in place
+    headers = get_auth_headers("GET", url, reuse_within_seconds=SIGNATURE_REUSE_SECONDS)
+
+    while True:
+        attempt += 1
+        resp = session.get(url, params=params, headers=headers, timeout=30)
+        _raise_for_status(resp)
 
-        data = resp.json()
+        data = parse_json(resp)
         status = data.get("jobStatus", "unknown")
-        logger.info("Poll attempt %d/%d — status: %s", attempt, MAX_POLL_ATTEMPTS, status)
+        logger.info("Poll attempt %d — status: %s", attempt, status)
 
         if status == "done":
             details_url = data.get("details")
@@ -117,18 +164,24 @@ def poll_snapshot(advertiser_id, snapshot_id):
         if status not in ("pending", "processing"):
             logger.warning("Unexpected status: %s", status)
 
-        if attempt < MAX_POLL_ATTEMPTS:
-            logger.info("Waiting %ds before next poll...", POLL_INTERVAL)
-            time.sleep(POLL_INTERVAL)
+        wait = delay + random.uniform(0, 0.25 * delay)
+        remaining = deadline - time.monotonic()
+        if wait > remaining:
+            break
+
+        logger.info("Waiting %.1fs before next poll...", wait)
+        time.sleep(wait)
+        delay = min(POLL_INTERVAL, delay * POLL_BACKOFF_FACTOR)
+        refresh_auth_headers(headers, "GET", url, reuse_within_seconds=SIGNATURE_REUSE_SECONDS)
 
     raise TimeoutError(
-        f"Snapshot did not complete after {MAX_POLL_ATTEMPTS} attempts "
-        f"(~{MAX_POLL_ATTEMPTS * POLL_INTERVAL // 60} minutes)"
+        f"Snapshot did not complete after {attempt} attempts "
+        f"(~{budget // 60} minutes)"
     )
 
 
 def download_report(file_url, advertiser_id, output_path):
-    """Download a gzip report file, decompress it, and save as CSV.
+    """Download a gzip report file, decompressing it on the fly into a CSV.
 
     Args:
         file_url: The 'details' URL from the poll response.
@@ -138,10 +191,8 @@ def download_report(file_url, advertiser_id, output_path):
     Returns:
         The output file path.
     """
-    parsed = urlparse(file_url)
     # Extract the file ID from the path (last segment)
-    path_parts = parsed.path.rstrip("/").split("/")
-    file_id = path_parts[-1] if path_parts else ""
+    file_id = url_path(file_url).rstrip("/").rpartition("/")[2]
 
     if not file_id:
         raise ValueError(f"Could not extract file ID from URL: {file_url}")
@@ -154,27 +205,32 @@ def download_report(file_url, advertiser_id, output_path):
     # Remove Content-Type for download request
     headers.pop("Content-Type", None)
 
-    resp = requests.get(download_url, params=params, headers=headers, stream=True, timeout=120)
-    resp.raise_for_status()
-
-    # Write the raw gzip response to a temp file, then decompress
-    gz_path = output_path + ".gz"
-    with open(gz_path, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=8192):
-            f.write(chunk)
-
-    logger.info("Decompressing gzip file...")
-    with gzip.open(gz_path, "rb") as gz_file:
-        with open(output_path, "wb") as csv_file:
-            while True:
-                chunk = gz_file.read(8192)
-                if not chunk:
-                    break
-                csv_file.write(chunk)
-
-    # Clean up the .gz file
-    import os
-    os.remove(gz_path)
+    resp = session.get(download_url, params=params, headers=headers, stream=True, timeout=120)
+    _raise_for_status(resp)
+
+    # Decompress straight from the response stream into the CSV file,
+    # reading the compressed side in DOWNLOAD_CHUNK_SIZE blocks as well
+    # (GzipFile alone reads 8 KiB at a time before Python 3.12). urllib3
+    # must not close resp.raw at end of body, or gzip's final EOF check
+    # reads a closed file through the buffer.
+    # The CSV is written under a ".part" name and only moved into place once
+    # the whole stream decompressed, so a dropped connection never leaves a
+    # truncated report that looks finished.
+    logger.info("Decompressing gzip stream...")
+    part_path = output_path + ".part"
+    resp.raw.auto_close = False
+    raw = io.BufferedReader(resp.raw, buffer_size=DOWNLOAD_CHUNK_SIZE)
+    try:
+        with resp, gzip.GzipFile(fileobj=raw) as gz_file:
+            with open(part_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as csv_file:
+                shutil.copyfileobj(gz_file, csv_file, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(part_path, output_path)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except FileNotFoundError:
+            pass
+        raise
 
     logger.info("Report saved to: %s", output_path)
     return output_path
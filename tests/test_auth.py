@@ -0,0 +1,62 @@
+import json
+import os
+import stat
+import time
+
+import pytest
+
+import auth
+
+
+@pytest.fixture
+def token_path(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    monkeypatch.setattr(auth, "TOKEN_CACHE_PATH", str(path))
+    monkeypatch.setattr(auth, "WALMART_CLIENT_ID", "client-a")
+    return path
+
+
+def test_token_file_round_trip(token_path):
+    expires_at = time.time() + 3000
+    auth._write_token_file("tok", expires_at)
+
+    assert auth._read_token_file(time.time()) == ("tok", expires_at)
+
+
+def test_token_file_is_private(token_path):
+    auth._write_token_file("tok", time.time() + 3000)
+
+    assert stat.S_IMODE(os.stat(token_path).st_mode) == 0o600
+
+
+def test_token_file_ignored_for_other_client_id(token_path, monkeypatch):
+    auth._write_token_file("tok", time.time() + 3000)
+    monkeypatch.setattr(auth, "WALMART_CLIENT_ID", "client-b")
+
+    assert auth._read_token_file(time.time()) is None
+
+
+def test_token_file_ignored_when_expired(token_path):
+    now = time.time()
+    auth._write_token_file("tok", now - 1)
+
+    assert auth._read_token_file(now) is None
+
+
+def test_token_file_ignored_when_corrupt(token_path):
+    token_path.write_text("{not json")
+
+    assert auth._read_token_file(time.time()) is None
+
+
+def test_token_file_lock_failure_does_not_chain_errors(tmp_path, monkeypatch):
+    # A regular file where the cache directory should be makes makedirs fail
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(auth, "TOKEN_CACHE_PATH", str(blocker / "token.json"))
+
+    with pytest.raises(RuntimeError) as excinfo:
+        with auth._token_file_lock():
+            raise RuntimeError("token POST failed")
+
+    assert excinfo.value.__context__ is None
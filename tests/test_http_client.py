@@ -0,0 +1,24 @@
+from urllib.parse import urlsplit
+
+import pytest
+
+from http_client import url_path
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://developer.api.us.walmart.com/api-proxy/service/display/api/v1/api/v1/snapshot",
+        "https://advertising.walmart.com/display/file/xyz789?token=1",
+        "https://a.com/x/y?z=1#f",
+        "https://a.com/x/y/",
+        "https://a.com/",
+        "https://a.com",
+        "https://a.com?q=1",
+        "https://x?a=/b",
+        "https://x#f/b",
+        "https://x/a?b#c/d",
+    ],
+)
+def test_url_path_matches_urlsplit(url):
+    assert url_path(url) == urlsplit(url).path
@@ -0,0 +1,104 @@
+import gzip
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import snapshot_client
+
+
+def _serve(body):
+    """Start a local HTTP server that answers every GET with the given bytes."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.mark.parametrize("size", [100, 3 * (1 << 20)])
+def test_download_report_streams_gzip_to_csv(tmp_path, monkeypatch, size):
+    csv_bytes = b"a,b,c\n" + b"".join(
+        f"{i},{i * 2},row{i}\n".encode() for i in range(size // 16)
+    )
+    server = _serve(gzip.compress(csv_bytes))
+    try:
+        monkeypatch.setattr(
+            snapshot_client, "DOWNLOAD_URL", f"http://127.0.0.1:{server.server_port}/file"
+        )
+        monkeypatch.setattr(
+            snapshot_client, "get_auth_headers", lambda method, url: {"Content-Type": "application/json"}
+        )
+
+        output_path = str(tmp_path / "report.csv")
+        result = snapshot_client.download_report(
+            file_url="https://advertising.walmart.com/display/file/xyz789?token=1",
+            advertiser_id="500001",
+            output_path=output_path,
+        )
+    finally:
+        server.shutdown()
+
+    assert result == output_path
+    with open(output_path, "rb") as f:
+        assert f.read() == csv_bytes
+    assert not os.path.exists(output_path + ".gz")
+    assert not os.path.exists(output_path + ".part")
+
+
+def test_download_report_truncated_body_leaves_no_csv(tmp_path, monkeypatch):
+    csv_bytes = b"a,b,c\n" + b"".join(f"{i},{i * 2},row{i}\n".encode() for i in range(200000))
+    compressed = gzip.compress(csv_bytes)
+    server = _serve(compressed[: len(compressed) // 2])
+    try:
+        monkeypatch.setattr(
+            snapshot_client, "DOWNLOAD_URL", f"http://127.0.0.1:{server.server_port}/file"
+        )
+        monkeypatch.setattr(
+            snapshot_client, "get_auth_headers", lambda method, url: {"Content-Type": "application/json"}
+        )
+
+        output_path = str(tmp_path / "report.csv")
+        with pytest.raises(EOFError):
+            snapshot_client.download_report(
+                file_url="https://advertising.walmart.com/display/file/xyz789",
+                advertiser_id="500001",
+                output_path=output_path,
+            )
+    finally:
+        server.shutdown()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_401_discards_cached_token(tmp_path, monkeypatch):
+    import auth
+
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+    monkeypatch.setattr(auth, "TOKEN_CACHE_PATH", str(token_path))
+    monkeypatch.setitem(auth._token_cache, "access_token", "stale")
+    monkeypatch.setitem(auth._token_cache, "expires_at", float("inf"))
+
+    class Response:
+        status_code = 401
+
+        def raise_for_status(self):
+            raise RuntimeError("401")
+
+    with pytest.raises(RuntimeError):
+        snapshot_client._raise_for_status(Response())
+
+    assert auth._token_cache["access_token"] is None
+    assert not token_path.exists()